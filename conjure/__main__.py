@@ -2,14 +2,21 @@
 """
 Command-line interface for conjure.
 """
+import csv
+import functools
+import gzip
+import os
+import re
 import sys
 import json
-import pandas as pd
-from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Tuple
 import typer
 from rich.console import Console
-from rich.text import Text
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 try:
     from .conjure import Conjure
@@ -21,20 +28,269 @@ except ImportError:
 # Set up rich warning formatting
 setup_warning_filter()
 
+
 # Create rich console for stderr output
 console = Console(stderr=True)
 
+
+# Matches the rich markup tags used in CLI messages, e.g. "[dim]" or "[/bold red]"
+MARKUP_TAG_RE = re.compile(r"\[/?[a-z ]+\]")
+
+
+def _log(message: str, markup: bool = True) -> None:
+    """Write a status message to stderr.
+
+    Rich is only used when stderr is a terminal; when it is piped or redirected the
+    markup tags are stripped and the text is written directly.
+    """
+    if sys.stderr.isatty():
+        console.print(message, markup=markup, highlight=markup)
+    else:
+        sys.stderr.write((MARKUP_TAG_RE.sub("", message) if markup else message) + "\n")
+
+
+def _write_json(obj) -> None:
+    """Write obj to stdout as JSON, using orjson when it is installed.
+
+    Output is indented for a terminal and compact when piped (e.g. into `edsl`),
+    where the whitespace only costs encoding time.
+    """
+    pretty = sys.stdout.isatty()
+
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+        try:
+            data = orjson.dumps(obj, option=option)
+        except TypeError:
+            # orjson rejects some values the stdlib encoder accepts (e.g. big ints)
+            pass
+        else:
+            sys.stdout.flush()
+            sys.stdout.buffer.write(data)
+            sys.stdout.buffer.write(b"\n")
+            sys.stdout.buffer.flush()
+            return
+
+    # Encode incrementally so the full output string is never held in memory
+    encoder = json.JSONEncoder(indent=2) if pretty else json.JSONEncoder(separators=(",", ":"))
+    for chunk in encoder.iterencode(obj):
+        sys.stdout.write(chunk)
+    sys.stdout.write("\n")
+    sys.stdout.flush()
+
+
+# Amount of encoded JSON collected before each write to the gzip stream
+GZIP_WRITE_BLOCK_SIZE = 1 << 16
+
+# Amount of piped input read from stdin at a time
+STDIN_READ_BLOCK_SIZE = 1 << 20
+
+# Leading bytes identifying the binary formats conjure can read. Stata files
+# before format 117 start with a version byte (113-115), a byte-order byte
+# (1 = big-endian, 2 = little-endian) and a filetype byte of 1.
+FILE_SIGNATURES = (
+    (b"$FL2", "sav"),
+    (b"$FL3", "sav"),
+    (b"<stata_dta>", "dta"),
+) + tuple(
+    (bytes((version, byteorder, 1)), "dta")
+    for version in (0x71, 0x72, 0x73)
+    for byteorder in (1, 2)
+)
+
+
+def _sniff_file_type(head: bytes) -> str:
+    """Return the file type of data starting with head, defaulting to CSV.
+
+    >>> _sniff_file_type(b"$FL2@(#) IBM SPSS STATISTICS")
+    'sav'
+    >>> _sniff_file_type(b"<stata_dta><header><release>118")
+    'dta'
+    >>> _sniff_file_type(b"r\\x02\\x01\\x00")
+    'dta'
+    >>> _sniff_file_type(b"question_1,question_2\\n")
+    'csv'
+    """
+    for signature, file_type in FILE_SIGNATURES:
+        if head.startswith(signature):
+            return file_type
+    return "csv"
+
+
+# Cell values treated as missing in the data dictionary CSV (matches pandas' defaults)
+MISSING_CELL_VALUES = frozenset({
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan",
+    "1.#IND", "1.#QNAN", "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a", "nan", "null",
+})
+
+
+def _resolve_column(columns, column_spec: str) -> int:
+    """Return the position of a data dictionary column given by name or (0-based) index.
+
+    Negative indices count from the last column.
+
+    >>> _resolve_column(["name", "text"], "text")
+    1
+    >>> _resolve_column(["name", "text"], "-2")
+    0
+    """
+    try:
+        col_index = int(column_spec)
+    except ValueError:
+        if column_spec not in columns:
+            raise ValueError(f"Column '{column_spec}' not found in data dictionary CSV")
+        return columns.index(column_spec)
+
+    if not -len(columns) <= col_index < len(columns):
+        raise ValueError(f"Column index {col_index} out of range (0-{len(columns)-1})")
+    return col_index % len(columns)
+
+
+def _read_stdin() -> Tuple[bytearray, str]:
+    """Read the survey data piped to stdin, returning its bytes and sniffed file type."""
+    # Check if stdin has data
+    if sys.stdin.isatty():
+        _log("[red]Error:[/red] No file path provided and no data piped to stdin")
+        sys.exit(1)
+    
+    # Sniff the format from the first block, then read the rest as raw bytes;
+    # they are parsed in memory without a temporary file. Only the first block is
+    # checked for emptiness - no valid data file starts with 4 KB of whitespace.
+    head = sys.stdin.buffer.read(4096)
+    if not head.strip():
+        _log("[red]Error:[/red] No data received from stdin")
+        sys.exit(1)
+    file_type = _sniff_file_type(head)
+
+    # Grow one buffer block by block, so the payload is never copied whole
+    data = bytearray(head)
+    for block in iter(functools.partial(sys.stdin.buffer.read, STDIN_READ_BLOCK_SIZE), b""):
+        data += block
+    return data, file_type
+
+
+def _load_question_texts(data_dictionary_csv, question_name_column: str, question_text_column: str, silent: bool) -> Dict[str, str]:
+    """Return a mapping of lowercased question names to question texts from a data dictionary CSV."""
+    if not silent:
+        _log(f"[blue]Loading data dictionary:[/blue] {data_dictionary_csv}")
+    
+    # The dictionary is only needed as a small {name: text} mapping, so
+    # read it with the stdlib csv reader rather than loading pandas
+    with open(data_dictionary_csv, newline="", encoding="latin-1") as f:
+        reader = csv.reader(f)
+        columns = next(reader, [])
+
+        if not silent:
+            _log(f"[dim]Data dictionary columns: {columns}[/dim]")
+
+        # Get column positions by name or index
+        name_index = _resolve_column(columns, question_name_column)
+        text_index = _resolve_column(columns, question_text_column)
+
+        rows = list(reader)
+
+    # Create mapping from question names to question texts, filtering out missing values
+    # Use lowercase keys for case-insensitive matching; rows too short to hold
+    # both cells are missing one of them
+    width = max(name_index, text_index)
+    question_name_to_text = {
+        row[name_index].lower(): row[text_index]
+        for row in rows
+        if len(row) > width
+        and row[name_index] not in MISSING_CELL_VALUES
+        and row[text_index] not in MISSING_CELL_VALUES
+    }
+
+    if not silent:
+        _log(f"[dim]Data dictionary shape: ({len(rows)}, {len(columns)})[/dim]")
+        _log(f"[dim]Loaded {len(question_name_to_text)} question mappings[/dim]")
+    return question_name_to_text
+
+
+def _print_dictionary_diagnostics(question_texts: Dict[str, str], actual_columns: frozenset, diagnostics: bool) -> None:
+    """Report how well the data dictionary matched the columns of the data file."""
+    dict_questions = question_texts.keys()  # Already lowercase
+    
+    matched_questions = dict_questions & actual_columns
+    unmatched_from_dict = dict_questions - actual_columns
+    unmatched_from_data = actual_columns - dict_questions
+    
+    _log(f"[cyan]Data Dictionary Usage Diagnostics:[/cyan]")
+    _log(f"  📊 Total questions in data dictionary: {len(dict_questions)}")
+    _log(f"  📋 Total columns in data file: {len(actual_columns)}")
+    _log(f"  ✅ Matched questions: {len(matched_questions)}")
+    _log(f"  ❌ Unmatched from dictionary: {len(unmatched_from_dict)}")
+    _log(f"  ❓ Unmatched from data: {len(unmatched_from_data)}")
+    
+    # Per-question listings can run to thousands of lines, so they are opt-in
+    # and printed as one pre-joined block without markup parsing
+    if diagnostics:
+        for heading, names in (
+            ("Dictionary questions not found in data", unmatched_from_dict),
+            ("Data columns not found in dictionary", unmatched_from_data),
+            ("Successfully matched questions", matched_questions),
+        ):
+            if names:
+                _log(f"  [dim]{heading}:[/dim]")
+                body = "\n".join(f"    • {q}" for q in sorted(names))
+                _log(body, markup=False)
+    
+    match_rate = (len(matched_questions) / len(dict_questions)) * 100 if dict_questions else 0
+    _log(f"  📈 Dictionary match rate: {match_rate:.1f}%")
+
+
+def _save_json_gz(results, filename: str, compresslevel: int) -> None:
+    """Save results to a .json.gz filename as gzip-compressed JSON.
+
+    This writes the same JSON as Results.save (results.to_dict(), without the
+    edsl version), which takes no compression level. The encoder output is
+    written in large blocks through a 1 MiB file buffer; low compression levels
+    are much cheaper than gzip's default of 9 and barely larger on JSON, and
+    mtime=0 keeps the output reproducible.
+    """
+    with open(filename, "wb", buffering=1 << 20) as raw, gzip.GzipFile(
+        fileobj=raw, mode="wb", compresslevel=compresslevel, mtime=0
+    ) as gz:
+        pending, pending_size = [], 0
+        for chunk in json.JSONEncoder().iterencode(results.to_dict()):
+            pending.append(chunk)
+            pending_size += len(chunk)
+            if pending_size >= GZIP_WRITE_BLOCK_SIZE:
+                gz.write("".join(pending).encode())
+                pending, pending_size = [], 0
+        gz.write("".join(pending).encode())
+
+
+def _emit(results, json_gz_filename: Optional[str], gzip_level: int, silent: bool) -> None:
+    """Save results to a file, or write them to stdout as JSON.
+
+    Only .json.gz filenames are written by the CLI itself, at gzip_level; any
+    other name is left to Results.save, which picks the format from it.
+    """
+    if json_gz_filename:
+        if json_gz_filename.endswith(".json.gz"):
+            _save_json_gz(results, json_gz_filename, gzip_level)
+        else:
+            results.save(json_gz_filename)
+        if not silent:
+            _log(f"[green]✓[/green] Results saved to {json_gz_filename}")
+    else:
+        _write_json(results.to_dict(add_edsl_version=True))
+
+
 app = typer.Typer()
 
 @app.command()
 def main(
-    file_path: Optional[Path] = typer.Argument(None, help="Path to the input survey data file (or stdin if not provided)"),
+    file_path: Optional[str] = typer.Argument(None, help="Path to the input survey data file (or stdin if not provided)"),
     json_gz_filename: Optional[str] = typer.Option(None, "--json-gz-filename", help="Save results to compressed JSON file"),
+    gzip_level: int = typer.Option(3, "--gzip-level", min=1, max=9, help="Compression level (1-9) used when --json-gz-filename ends in .json.gz"),
     silent: bool = typer.Option(False, "--silent", "-s", help="Disable verbose output"),
     sample: Optional[int] = typer.Option(None, "--sample", help="Sample size to use instead of processing all agents"),
-    data_dictionary_csv: Optional[Path] = typer.Option(None, "--data-dictionary-csv", help="Path to CSV file containing question names and texts"),
+    data_dictionary_csv: Optional[str] = typer.Option(None, "--data-dictionary-csv", help="Path to CSV file containing question names and texts"),
     question_name_column: str = typer.Option("question_name", "--question-name-column", help="Column name or index (0-based) for question names in data dictionary CSV"),
-    question_text_column: str = typer.Option("question_text", "--question-text-column", help="Column name or index (0-based) for question texts in data dictionary CSV")
+    question_text_column: str = typer.Option("question_text", "--question-text-column", help="Column name or index (0-based) for question texts in data dictionary CSV"),
+    diagnostics: bool = typer.Option(False, "--diagnostics", help="List every matched and unmatched data dictionary question")
 ):
     """
     Convert survey data files into EDSL objects.
@@ -72,166 +328,62 @@ def main(
     try:
         # Handle stdin input
         if file_path is None:
-            # Check if stdin has data
-            if sys.stdin.isatty():
-                console.print("[red]Error:[/red] No file path provided and no data piped to stdin")
-                sys.exit(1)
-            
-            # Read from stdin
-            import tempfile
-            import os
-            
-            stdin_data = sys.stdin.read()
-            if not stdin_data.strip():
-                console.print("[red]Error:[/red] No data received from stdin")
-                sys.exit(1)
-            
-            # Create a temporary file to store stdin data
-            # We need to determine the file type from the data content
-            # For now, assume CSV if no extension can be determined
-            temp_file = tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False)
-            temp_file.write(stdin_data)
-            temp_file.flush()
-            temp_file.close()
-            
-            file_path = Path(temp_file.name)
-            cleanup_temp_file = True
+            stdin_data, stdin_file_type = _read_stdin()
             
             if not silent:
-                console.print("[blue]Processing data from stdin[/blue]")
-                console.print(f"[dim]Temporary file: {file_path}[/dim]")
+                _log("[blue]Processing data from stdin[/blue]")
+                _log(f"[dim]File type: .{stdin_file_type}[/dim]")
         else:
-            cleanup_temp_file = False
-        
-        if not silent:
-            console.print(f"[blue]Processing file:[/blue] {file_path}")
-            console.print(f"[dim]File type: {file_path.suffix}[/dim]")
+            stdin_data = None
+            
+            if not silent:
+                _log(f"[blue]Processing file:[/blue] {file_path}")
+                _log(f"[dim]File type: {os.path.splitext(file_path)[1]}[/dim]")
         
         # Load question texts from data dictionary CSV if provided
         question_texts = None
         if data_dictionary_csv:
             try:
-                if not silent:
-                    console.print(f"[blue]Loading data dictionary:[/blue] {data_dictionary_csv}")
-                
-                dict_df = pd.read_csv(data_dictionary_csv, encoding='latin-1')
-                
-                if not silent:
-                    console.print(f"[dim]Data dictionary shape: {dict_df.shape}[/dim]")
-                    console.print(f"[dim]Data dictionary columns: {list(dict_df.columns)}[/dim]")
-                
-                # Handle column specification by name or index
-                def get_column_data(df, column_spec):
-                    if column_spec.isdigit():
-                        col_index = int(column_spec)
-                        if col_index < 0 or col_index >= len(df.columns):
-                            raise ValueError(f"Column index {col_index} out of range (0-{len(df.columns)-1})")
-                        return df.iloc[:, col_index]
-                    else:
-                        if column_spec not in df.columns:
-                            raise ValueError(f"Column '{column_spec}' not found in data dictionary CSV")
-                        return df[column_spec]
-                
-                # Get column data by name or index
-                question_name_data = get_column_data(dict_df, question_name_column)
-                question_text_data = get_column_data(dict_df, question_text_column)
-                
-                # Create mapping from question names to question texts, filtering out NaN values
-                # Use lowercase keys for case-insensitive matching
-                question_name_to_text = {}
-                for name, text in zip(question_name_data, question_text_data):
-                    # Skip rows where either name or text is NaN/None
-                    if pd.notna(name) and pd.notna(text):
-                        question_name_to_text[str(name).lower()] = str(text)
-                
-                if not silent:
-                    console.print(f"[dim]Loaded {len(question_name_to_text)} question mappings[/dim]")
-                
-                # Store the mapping for later use
-                question_texts = question_name_to_text
-                
+                question_texts = _load_question_texts(
+                    data_dictionary_csv, question_name_column, question_text_column, silent
+                )
             except Exception as e:
-                console.print(f"[red]Error loading data dictionary:[/red] {e}")
+                _log(f"[red]Error loading data dictionary:[/red] {e}")
                 sys.exit(1)
         
         # Create conjure instance
-        conjure_instance = Conjure(str(file_path), question_names_to_question_text=question_texts)
+        if stdin_data is not None:
+            conjure_instance = Conjure.from_bytes(stdin_data, suffix=stdin_file_type, question_names_to_question_text=question_texts)
+        else:
+            conjure_instance = Conjure(file_path, question_names_to_question_text=question_texts)
         
         # Add diagnostics about data dictionary usage
-        if data_dictionary_csv and question_texts and not silent:
-            # Get actual column names from the data file (convert to lowercase for case-insensitive matching)
-            actual_columns = set(name.lower() for name in conjure_instance.question_names)
-            dict_questions = set(question_texts.keys())  # Already lowercase from above
-            
-            matched_questions = actual_columns.intersection(dict_questions)
-            unmatched_from_dict = dict_questions - actual_columns
-            unmatched_from_data = actual_columns - dict_questions
-            
-            console.print(f"[cyan]Data Dictionary Usage Diagnostics:[/cyan]")
-            console.print(f"  📊 Total questions in data dictionary: {len(dict_questions)}")
-            console.print(f"  📋 Total columns in data file: {len(actual_columns)}")
-            console.print(f"  ✅ Matched questions: {len(matched_questions)}")
-            console.print(f"  ❌ Unmatched from dictionary: {len(unmatched_from_dict)}")
-            console.print(f"  ❓ Unmatched from data: {len(unmatched_from_data)}")
-            
-            if unmatched_from_dict:
-                console.print(f"  [dim]Dictionary questions not found in data:[/dim]")
-                for q in sorted(unmatched_from_dict):
-                    console.print(f"    • {q}")
-            
-            if unmatched_from_data:
-                console.print(f"  [dim]Data columns not found in dictionary:[/dim]")
-                for q in sorted(unmatched_from_data):
-                    console.print(f"    • {q}")
-                    
-            if matched_questions:
-                console.print(f"  [dim]Successfully matched questions:[/dim]")
-                for q in sorted(matched_questions):
-                    console.print(f"    • {q}")
-                    
-            match_rate = (len(matched_questions) / len(dict_questions)) * 100 if dict_questions else 0
-            console.print(f"  📈 Dictionary match rate: {match_rate:.1f}%")
-        elif data_dictionary_csv and not silent:
-            if not question_texts:
-                console.print(f"[yellow]Warning: Data dictionary CSV was provided but no question texts were loaded[/yellow]")
+        if data_dictionary_csv and not silent:
+            if question_texts:
+                _print_dictionary_diagnostics(question_texts, conjure_instance.lower_question_names, diagnostics)
+            else:
+                _log(f"[yellow]Warning: Data dictionary CSV was provided but no question texts were loaded[/yellow]")
         
         # Store verbose flag for later use
         conjure_instance._verbose = not silent
         
         if not silent:
-            console.print(f"[dim]Created conjure instance of type: {type(conjure_instance).__name__}[/dim]")
+            _log(f"[dim]Created conjure instance of type: {type(conjure_instance).__name__}[/dim]")
         
         # Get results
         results = conjure_instance.to_results(verbose=not silent, sample_size=sample)
         
-        # Handle output
-        if json_gz_filename:
-            # Save to compressed JSON file
-            results.save(json_gz_filename)
-            if not silent:
-                console.print(f"[green]✓[/green] Results saved to {json_gz_filename}")
-        else:
-            # Output JSON to stdout
-            results_dict = results.to_dict(add_edsl_version=True)
-            print(json.dumps(results_dict, indent=2))
+        _emit(results, json_gz_filename, gzip_level, silent)
         
         if not silent:
-            console.print("[green]✓[/green] File processed successfully")
+            _log("[green]✓[/green] File processed successfully")
         
     except ValueError as e:
-        console.print(f"[red]Error:[/red] {e}")
+        _log(f"[red]Error:[/red] {e}")
         sys.exit(1)
     except Exception as e:
-        console.print(f"[red]Unexpected error:[/red] {e}")
+        _log(f"[red]Unexpected error:[/red] {e}")
         sys.exit(1)
-    finally:
-        # Clean up temporary file if created
-        if 'cleanup_temp_file' in locals() and cleanup_temp_file:
-            import os
-            try:
-                os.unlink(file_path)
-            except OSError:
-                pass
 
 
 if __name__ == '__main__':
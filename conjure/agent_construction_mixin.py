@@ -1,12 +1,16 @@
+import contextlib
+import operator
 import random
 import sys
-from typing import Generator, List, Optional, Union, Callable
+import time
+from typing import Generator, List, Optional, Tuple, Union
+import numpy as np
 from edsl.agents import Agent
 from edsl.agents import AgentList
 from edsl.questions import QuestionBase
 from edsl.results import Results
 from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn, TimeRemainingColumn
+from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
 from rich.table import Table
 from rich.panel import Panel
 import traceback
@@ -14,14 +18,81 @@ import psutil
 import gc
 
 
+# Presents each trait as the question the respondent was asked and their answer
+TRAITS_PRESENTATION_TEMPLATE = "\n".join(
+    [
+        "{% for key, value in traits.items() %}",
+        "When you were asked: {{ codebook[key] if codebook and key in codebook else key.replace('_agent', '') }}",
+        "{% if value is iterable and value is not string %}",
+        "    {% for v in value %}",
+        "You responded: {{ v }}",
+        "    {% endfor %}",
+        "{% else %}",
+        "You responded: {{ value }}",
+        "{% endif %}",
+        "",
+        "{% endfor %}",
+    ]
+)
+
+# Number of agents run by a dryrun to estimate the time for the full survey
+DRYRUN_SAMPLE_SIZE = 30
+
+# Largest duration, in seconds, shown in each unit, with that unit's length in seconds
+_DURATION_UNITS = ((60, 1, "seconds"), (3600, 60, "minutes"), (None, 3600, "hours"))
+
+
+def _format_duration(seconds: float) -> str:
+    """Format a duration in the largest unit that keeps it readable.
+
+    >>> _format_duration(42)
+    '42.0 seconds'
+    >>> _format_duration(90)
+    '1.5 minutes'
+    >>> _format_duration(5400)
+    '1.5 hours'
+    """
+    for limit, unit_seconds, unit in _DURATION_UNITS:
+        if limit is None or seconds < limit:
+            return f"{seconds / unit_seconds:.1f} {unit}"
+
+
+class _NoProgress:
+    """Stands in for a rich Progress when progress is not displayed."""
+
+    def add_task(self, description, total=None, **kwargs) -> int:
+        return 0
+
+    def update(self, task_id, **kwargs) -> None:
+        pass
+
+
+def _answer_from_traits(self, question: "QuestionBase", scenario=None):
+    """Answer a question with the agent's own response to it; bound to each agent."""
+    return self.traits.get(question.question_name + "_agent", None)
+
+
 class AgentConstructionModule:
     def __init__(self, input_data):
         self.input_data = input_data
-    
-    def agent(self, index) -> Agent:
+
+    def _agent_traits_layout(self) -> Tuple[tuple, dict]:
+        """Return the trait name for each question, in question order, and the trait codebook.
+
+        Built once per agent() or to_agent_list() call rather than cached, as
+        callers may edit the question names and texts in place.
+        """
+        trait_names = tuple(
+            sys.intern(f"{qn}_agent") for qn in self.input_data.question_names
+        )
+        codebook = {k + "_agent": v for k, v in self.input_data.names_to_texts.items()}
+        return trait_names, codebook
+
+    def agent(self, index, attach_answering: bool = True) -> Agent:
         """Return an agent constructed from the data.
 
         :param index: The index of the agent to construct.
+        :param attach_answering: If True, the agent answers questions directly from its traits.
 
         >>> from .input_data import InputDataABC
         >>> id = InputDataABC.example()
@@ -30,42 +101,77 @@ class AgentConstructionModule:
 
 
         """
-        responses = [responses[index] for responses in self.input_data.raw_data]
-        traits = {f"{qn}_agent": r for qn, r in zip(self.input_data.question_names, responses)}
-
-        adjusted_codebook = {k + "_agent": v for k, v in self.input_data.names_to_texts.items()}
-
-        # Create a custom traits presentation template
-        template_lines = [
-            "{% for key, value in traits.items() %}",
-            "When you were asked: {{ codebook[key] if codebook and key in codebook else key.replace('_agent', '') }}",
-            "{% if value is iterable and value is not string %}",
-            "    {% for v in value %}",
-            "You responded: {{ v }}",
-            "    {% endfor %}",
-            "{% else %}",
-            "You responded: {{ value }}",
-            "{% endif %}",
-            "",
-            "{% endfor %}",
-        ]
-        traits_presentation_template = "\n".join(template_lines)
-
-        a = Agent(traits=traits, codebook=adjusted_codebook, traits_presentation_template=traits_presentation_template)
-
-        def construct_answer_dict_function(traits: dict) -> Callable:
-            def func(self, question: "QuestionBase", scenario=None):
-                return traits.get(question.question_name + "_agent", None)
-
-            return func
-
-        a.add_direct_question_answering_method(construct_answer_dict_function(traits))
+        responses = [column[index] for column in self.input_data.raw_data]
+        return self._build_agent(responses, *self._agent_traits_layout(), attach_answering)
+
+    def _build_agent(
+        self, responses: list, trait_names: tuple, codebook: dict, attach_answering: bool = True
+    ) -> Agent:
+        """Return an agent with one trait per question, given its responses in question order."""
+        traits = dict(zip(trait_names, responses))
+
+        a = Agent(
+            traits=traits,
+            codebook=dict(codebook),
+            traits_presentation_template=TRAITS_PRESENTATION_TEMPLATE,
+        )
+
+        if attach_answering:
+            a.add_direct_question_answering_method(_answer_from_traits)
         return a
 
-    def _agents(self, indices) -> Generator[Agent, None, None]:
+    def _agents(self, indices, attach_answering: bool = True) -> Generator[Agent, None, None]:
         """Return a generator of agents, one for each index."""
-        for idx in indices:
-            yield self.agent(idx)
+        indices = [int(i) for i in indices]
+        raw_data = self.input_data.raw_data
+        # Gather only the selected observations, a C-level itemgetter pass per
+        # question; raw_data is read on each call, as callers may edit it in place
+        if len(indices) == 1:
+            rows = [[column[indices[0]] for column in raw_data]]
+        elif raw_data:
+            pick = operator.itemgetter(*indices)
+            rows = zip(*(pick(column) for column in raw_data))
+        else:
+            rows = [[] for _ in indices]
+        trait_names, codebook = self._agent_traits_layout()
+        for responses in rows:
+            yield self._build_agent(responses, trait_names, codebook, attach_answering)
+
+    def _resolve_indices(
+        self, indices: Optional[List], sample_size: Optional[int], seed: str
+    ) -> np.ndarray:
+        """Validate the requested indices or draw the sample, returning the indices to build."""
+        if indices is not None and (sample_size or seed != "edsl"):
+            raise ValueError(
+                "You cannot pass both indices and sample_size/seed, as these are mutually exclusive."
+            )
+
+        num_observations = self.input_data.num_observations
+
+        if indices is not None:
+            # Materialize the indices once; validation and row gathering both use the array
+            indices = np.asarray(indices, dtype=np.intp)
+            if indices.size == 0:
+                raise ValueError("Indices must be a non-empty list.")
+            lowest, highest = indices.min(), indices.max()
+            if highest >= num_observations:
+                raise ValueError(
+                    f"Index {highest} is greater than the number of agents {num_observations}."
+                )
+            if lowest < 0:
+                raise ValueError(f"Index {lowest} is less than 0.")
+        elif sample_size is None:
+            indices = np.arange(num_observations, dtype=np.intp)
+        else:
+            if sample_size > num_observations:
+                raise ValueError(
+                    f"Sample size {sample_size} is greater than the number of agents {num_observations}."
+                )
+            indices = np.asarray(
+                random.Random(seed).sample(range(num_observations), sample_size),
+                dtype=np.intp,
+            )
+        return indices
 
     def to_agent_list(
         self,
@@ -89,37 +195,15 @@ class AgentConstructionModule:
         Traceback (most recent call last):
         ...
         ValueError: Index 2 is greater than the number of agents 2.
+        >>> al = id.agent_construction.to_agent_list(indices = [])
+        Traceback (most recent call last):
+        ...
+        ValueError: Indices must be a non-empty list.
         """
-        if indices and (sample_size or seed != "edsl"):
-            raise ValueError(
-                "You cannot pass both indices and sample_size/seed, as these are mutually exclusive."
-            )
-
-        if indices:
-            if len(indices) == 0:
-                raise ValueError("Indices must be a non-empty list.")
-            if max(indices) >= self.input_data.num_observations:
-                raise ValueError(
-                    f"Index {max(indices)} is greater than the number of agents {self.input_data.num_observations}."
-                )
-            if min(indices) < 0:
-                raise ValueError(f"Index {min(indices)} is less than 0.")
-
-        if indices is None:
-            if sample_size is None:
-                indices = range(self.input_data.num_observations)
-            else:
-                if sample_size > self.input_data.num_observations:
-                    raise ValueError(
-                        f"Sample size {sample_size} is greater than the number of agents {self.input_data.num_observations}."
-                    )
-                random.seed(seed)
-                indices = random.sample(range(self.input_data.num_observations), sample_size)
-
-        agents = list(self._agents(indices))
-        if remove_direct_question_answering_method:
-            for a in agents:
-                a.remove_direct_question_answering_method()
+        indices = self._resolve_indices(indices, sample_size, seed)
+        agents = list(
+            self._agents(indices, attach_answering=not remove_direct_question_answering_method)
+        )
         return AgentList(agents)
 
     def to_results(
@@ -161,15 +245,18 @@ class AgentConstructionModule:
                 pass  # Ignore if psutil diagnostics fail
         
         try:
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                BarColumn(),
-                TaskProgressColumn(),
-                TimeRemainingColumn(),
-                console=console,
-                disable=not verbose
-            ) as progress:
+            if verbose:
+                progress_context = Progress(
+                    SpinnerColumn(),
+                    TextColumn("[progress.description]{task.description}"),
+                    BarColumn(),
+                    TaskProgressColumn(),
+                    console=console,
+                )
+            else:
+                progress_context = contextlib.nullcontext(_NoProgress())
+
+            with progress_context as progress:
             
                 # Step 1: Create agent list
                 total_agents = sample_size if sample_size else (len(indices) if indices else self.input_data.num_observations)
@@ -183,12 +270,21 @@ class AgentConstructionModule:
                         console.print(f"[dim]Using specified indices: {len(indices)} agents[/dim]")
                 
                 try:
-                    agent_list = self.to_agent_list(
-                        indices=indices,
-                        sample_size=sample_size,
-                        seed=seed,
-                        remove_direct_question_answering_method=False,
-                    )
+                    if dryrun:
+                        # A dryrun only times a small sample, so only those agents are built
+                        selected = self._resolve_indices(indices, sample_size, seed)
+                        dryrun_sample = min(DRYRUN_SAMPLE_SIZE, len(selected))
+                        agent_list = self.to_agent_list(
+                            indices=selected[random.Random(seed).sample(range(len(selected)), dryrun_sample)],
+                            remove_direct_question_answering_method=False,
+                        )
+                    else:
+                        agent_list = self.to_agent_list(
+                            indices=indices,
+                            sample_size=sample_size,
+                            seed=seed,
+                            remove_direct_question_answering_method=False,
+                        )
                     progress.update(agent_task, completed=total_agents)
                     
                     if verbose:
@@ -236,9 +332,7 @@ class AgentConstructionModule:
             
                 # Step 3: Handle dryrun
                 if dryrun:
-                    import time
-                    
-                    DRYRUN_SAMPLE = min(30, len(agent_list))  # Don't sample more than we have
+                    DRYRUN_SAMPLE = len(agent_list)
                     dryrun_task = progress.add_task(f"[yellow]Running dryrun ({DRYRUN_SAMPLE} agents)...", total=DRYRUN_SAMPLE)
                     
                     if verbose:
@@ -246,7 +340,7 @@ class AgentConstructionModule:
 
                     try:
                         start = time.time()
-                        dryrun_results = survey.by(agent_list.sample(DRYRUN_SAMPLE)).run(
+                        dryrun_results = survey.by(agent_list).run(
                             disable_remote_cache=disable_remote_cache,
                             disable_remote_inference=disable_remote_inference,
                         )
@@ -256,7 +350,7 @@ class AgentConstructionModule:
                         
                         elapsed_time = end - start
                         time_per_agent = elapsed_time / DRYRUN_SAMPLE
-                        full_sample_time = time_per_agent * len(agent_list)
+                        full_sample_time = time_per_agent * total_agents
                         
                         console.print(f"[green]✓[/green] Dryrun completed: {DRYRUN_SAMPLE} agents in {elapsed_time:.2f}s ({time_per_agent:.2f}s per agent)")
                         
@@ -264,12 +358,7 @@ class AgentConstructionModule:
                             console.print(f"[dim]Dryrun produced {len(dryrun_results)} result records[/dim]")
                         
                         # Enhanced time estimates with better formatting
-                        if full_sample_time < 60:
-                            console.print(f"[bold yellow]📊 Estimated time for all {len(agent_list)} agents: {full_sample_time:.1f} seconds[/bold yellow]")
-                        elif full_sample_time < 3600:
-                            console.print(f"[bold yellow]📊 Estimated time for all {len(agent_list)} agents: {full_sample_time / 60:.1f} minutes[/bold yellow]")
-                        else:
-                            console.print(f"[bold yellow]📊 Estimated time for all {len(agent_list)} agents: {full_sample_time / 3600:.1f} hours[/bold yellow]")
+                        console.print(f"[bold yellow]📊 Estimated time for all {total_agents} agents: {_format_duration(full_sample_time)}[/bold yellow]")
                         
                         console.print(f"[dim]Use --sample to reduce the number of agents if this seems too long[/dim]")
                         return None
@@ -294,83 +383,63 @@ class AgentConstructionModule:
                 
                 # If we have more than 10 agents and verbose is enabled, do a timing estimate
                 if len(agent_list) > 10 and verbose:
-                    import time
-                    
                     console.print(f"[dim]Running timing sample with first 10 agents out of {len(agent_list)}[/dim]")
-                    
-                    # Time the first 10 agents
+
+                    # Time the first 10 agents on their own, so the estimate is not
+                    # skewed by other runs and a failure stops before the rest start
                     start_time = time.time()
                     sample_results = survey.by(agent_list[:10]).run(
                         disable_remote_cache=disable_remote_cache,
                         disable_remote_inference=disable_remote_inference,
                     )
-                    end_time = time.time()
-                    
+                    sample_time = time.time() - start_time
+
                     # Calculate timing estimates
-                    sample_time = end_time - start_time
                     time_per_agent = sample_time / 10
                     estimated_total_time = time_per_agent * len(agent_list)
-                    
+
                     # Update progress for completed sample
                     progress.update(run_task, completed=10)
-                    
+
                     console.print(f"[green]✓[/green] Sample of 10 agents completed in {sample_time:.2f}s")
                     console.print(f"[dim]Performance: {time_per_agent:.2f}s per agent[/dim]")
-                    
-                    if estimated_total_time < 60:
-                        console.print(f"[yellow]🕒 Estimated total time: {estimated_total_time:.1f} seconds[/yellow]")
-                    elif estimated_total_time < 3600:
-                        console.print(f"[yellow]🕒 Estimated total time: {estimated_total_time / 60:.1f} minutes[/yellow]")
-                    else:
-                        console.print(f"[yellow]🕒 Estimated total time: {estimated_total_time / 3600:.1f} hours[/yellow]")
-                    
+
+                    console.print(f"[yellow]🕒 Estimated total time: {_format_duration(estimated_total_time)}[/yellow]")
+
                     # Calculate estimated time for remaining agents
                     remaining_agents = len(agent_list) - 10
                     estimated_remaining_time = time_per_agent * remaining_agents
-                    
-                    if estimated_remaining_time < 60:
-                        time_display = f"{estimated_remaining_time:.1f} seconds"
-                    elif estimated_remaining_time < 3600:
-                        time_display = f"{estimated_remaining_time / 60:.1f} minutes"
-                    else:
-                        time_display = f"{estimated_remaining_time / 3600:.1f} hours"
-                    
+
+                    time_display = _format_duration(estimated_remaining_time)
+
                     console.print(f"[dim]Now running full survey with remaining {remaining_agents} agents (estimated time: {time_display})[/dim]")
-                    
-                    # Start full survey timer
-                    full_survey_start = time.time()
-                    
+
                     # Run the remaining agents
                     remaining_results = survey.by(agent_list[10:]).run(
                         disable_remote_cache=disable_remote_cache,
                         disable_remote_inference=disable_remote_inference,
                     )
-                    
+
                     # Calculate total elapsed time and throughput
-                    total_elapsed = time.time() - full_survey_start + sample_time
+                    total_elapsed = time.time() - start_time
                     throughput = len(agent_list) / total_elapsed if total_elapsed > 0 else 0
                     
-                    if total_elapsed < 60:
-                        console.print(f"[green]✓[/green] Total elapsed time: {total_elapsed:.1f} seconds")
-                    elif total_elapsed < 3600:
-                        console.print(f"[green]✓[/green] Total elapsed time: {total_elapsed / 60:.1f} minutes")
-                    else:
-                        console.print(f"[green]✓[/green] Total elapsed time: {total_elapsed / 3600:.1f} hours")
+                    console.print(f"[green]✓[/green] Total elapsed time: {_format_duration(total_elapsed)}")
                     
                     console.print(f"[blue]📊 Throughput: {throughput:.1f} agents/second[/blue]")
                     
                     # Update progress for completed agents
                     progress.update(run_task, completed=len(agent_list))
                     
-                    # Combine results
-                    results = sample_results + remaining_results
+                    # Combine results in place rather than copying both into a new Results
+                    sample_results.extend(remaining_results)
+                    results = sample_results
                 
                 else:
                     if verbose:
                         console.print(f"[dim]Running survey with {len(agent_list)} agents[/dim]")
                     
                     # Start timer for full survey
-                    import time
                     survey_start = time.time()
                     
                     results = survey.by(agent_list).run(
@@ -384,12 +453,7 @@ class AgentConstructionModule:
                     throughput = len(agent_list) / elapsed if elapsed > 0 else 0
                     
                     if verbose:
-                        if elapsed < 60:
-                            console.print(f"[green]✓[/green] Total elapsed time: {elapsed:.1f} seconds")
-                        elif elapsed < 3600:
-                            console.print(f"[green]✓[/green] Total elapsed time: {elapsed / 60:.1f} minutes")
-                        else:
-                            console.print(f"[green]✓[/green] Total elapsed time: {elapsed / 3600:.1f} hours")
+                        console.print(f"[green]✓[/green] Total elapsed time: {_format_duration(elapsed)}")
                         
                         console.print(f"[blue]📊 Throughput: {throughput:.1f} agents/second[/blue]")
             
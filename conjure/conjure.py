@@ -1,29 +1,49 @@
+import functools
+import os
 from typing import List, Optional, Dict, Callable, Union
 from edsl import FileStore
 
+
+@functools.cache
+def _get_handlers() -> Dict[str, type]:
+    """Map each supported file extension to its input data class, imported on first use."""
+    from .input_data_csv import InputDataCSV
+    from .input_data_spss import InputDataSPSS
+    from .input_data_stata import InputDataStata
+
+    return {
+        "csv": InputDataCSV,
+        "sav": InputDataSPSS,
+        "dta": InputDataStata,
+    }
+
+
+def _file_store_to_path(file_store: FileStore) -> str:
+    """Copy a FileStore to a temporary file with the right extension and return its path.
+
+    FileStore.path always names a real file (edsl materializes one from the
+    base64 content if needed), so it is copied on disk, via sendfile where
+    the platform supports it, instead of being decoded into memory first.
+    """
+    import shutil
+    import tempfile
+
+    with tempfile.NamedTemporaryFile(delete=False, suffix="." + file_store.suffix) as temp_file:
+        temp_path = temp_file.name
+
+    shutil.copyfile(file_store.path, temp_path)
+    return temp_path
+
+
 class Conjure:
     def __new__(cls, datafile_name: Union[str, FileStore], *args, **kwargs):
 
-        from .input_data_csv import InputDataCSV
-        from .input_data_spss import InputDataSPSS
-        from .input_data_stata import InputDataStata
-
         if isinstance(datafile_name, FileStore):
-            import tempfile
-            with tempfile.NamedTemporaryFile(delete=False) as temp_file:
-                temp_file_with_extension = temp_file.name + "." + datafile_name.suffix
-                datafile_name.write(temp_file_with_extension)
-                datafile_name = temp_file_with_extension
+            datafile_name = _file_store_to_path(datafile_name)
 
-        handlers = {
-            "csv": InputDataCSV,
-            "sav": InputDataSPSS,
-            "dta": InputDataStata,
-        }
+        file_type = os.path.splitext(datafile_name)[1][1:].lower()
 
-        file_type = datafile_name.split(".")[-1]
-
-        handler = handlers.get(file_type)
+        handler = _get_handlers().get(file_type)
         if handler is None:
             raise ValueError(f"Unsupported file type: {file_type}")
         
@@ -48,6 +68,19 @@ class Conjure:
         # The __init__ method in Conjure won't be called because __new__ returns a different class instance.
         pass
 
+    @classmethod
+    def from_bytes(cls, data: bytes, *, suffix: str = "csv", name: str = "stdin", **kwargs):
+        """Create an input data object from the raw contents of a data file.
+
+        :param data: The contents of the file, e.g. as read from stdin.
+        :param suffix: The file type of the data ('csv', 'sav' or 'dta').
+        :param name: The name reported as the datafile_name (without extension).
+
+        The data is handed to the input data class directly, so it is never
+        written to and re-read from disk just to dispatch on the file type.
+        """
+        return cls(f"{name}.{suffix.lstrip('.')}", data=data, **kwargs)
+
     @classmethod
     def example(cls):
         from InputData import InputDataABC
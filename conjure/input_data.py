@@ -1,14 +1,17 @@
 import base64
+import binascii
+import keyword
+import os
 import sys
+import time
 from abc import ABC, abstractmethod
 from typing import Dict, Callable, Optional, List, Generator, Tuple, Union
 from collections import namedtuple
 from typing import List, Union
 
 from edsl.questions import QuestionBase
-from edsl.scenarios import ScenarioList
+from edsl.scenarios import Scenario, ScenarioList
 from edsl.surveys import Survey
-from edsl.utilities import is_valid_variable_name
 from edsl.dataset import Dataset
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
@@ -17,11 +20,54 @@ from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskPr
 from .survey_responses import SurveyResponses
 from .naming_utilities import sanitize_string
 from .raw_question import RawQuestion
+from .utilities import convert_value
 from .agent_construction_mixin import AgentConstructionModule
 from .question_option_mixin import QuestionOptionModule
 from .input_data_mixin_question_stats import QuestionStatsModule
 from .question_type_mixin import QuestionTypeModule
-from .question_error_logger import QuestionErrorLogger, set_global_logger, log_creation_error
+from .question_error_logger import QuestionErrorLogger, set_global_logger
+
+# Bytes read per chunk when base64-encoding a datafile; a multiple of 3 so that
+# the chunks encode without padding and concatenate cleanly
+B64_READ_SIZE = 3 * (1 << 16)
+
+
+def _b64encode_file(path: str) -> str:
+    """Base64-encode a file in chunks into a buffer sized up front.
+
+    Only one copy of the encoded file is built, rather than holding the raw
+    file and its encoding in memory at the same time.
+    """
+    with open(path, "rb") as file:
+        size = os.fstat(file.fileno()).st_size
+        out = bytearray((size + 2) // 3 * 4)
+        chunk = bytearray(B64_READ_SIZE)
+        view = memoryview(chunk)
+        pos = 0
+        while n := file.readinto(chunk):
+            encoded = binascii.b2a_base64(view[:n], newline=False)
+            out[pos:pos + len(encoded)] = encoded
+            pos += len(encoded)
+    del out[pos:]
+    return out.decode("ascii")
+
+
+# Minimum number of seconds between progress updates while building a survey
+PROGRESS_UPDATE_INTERVAL = 0.05
+
+# Identifiers edsl refuses as question names: Python keywords and 'name' itself
+_RESERVED_QUESTION_NAMES = frozenset(keyword.kwlist) | {"name"}
+
+
+def _is_valid_question_name(name: str) -> bool:
+    """Return whether a question name is usable as-is.
+
+    Matches edsl's is_valid_variable_name(name, allow_name=False).
+
+    >>> _is_valid_question_name("morning"), _is_valid_question_name("class"), _is_valid_question_name("name")
+    (True, False, False)
+    """
+    return name.isidentifier() and name not in _RESERVED_QUESTION_NAMES
 
 
 class InputDataABC(ABC):
@@ -32,6 +78,9 @@ class InputDataABC(ABC):
     MULTIPLE_CHOICE_OTHER_THRESHOLD = 0.5
     OTHER_STRING = "Other:"
 
+    # Set by readers whose get_raw_data applies the answer codebook as it converts
+    codebook_applied_on_read = False
+
     question_attributes = [
         "num_responses",
         "num_unique_responses",
@@ -58,6 +107,7 @@ class InputDataABC(ABC):
         question_options: Optional[List] = None,
         order_options=False,
         question_name_repair_func: Callable = None,
+        data: Optional[bytes] = None,
     ):
         """Initialize the InputData object.
 
@@ -69,6 +119,7 @@ class InputDataABC(ABC):
         :param answer_codebook: The codebook for the answers.
         :param question_types: The types of the questions.
         :param question_options: The options for the questions.
+        :param data: The raw contents of the datafile, used instead of reading datafile_name.
 
         >>> id = InputDataABC.example(question_names = ['a','b'], answer_codebook = {'a': {'1':'yes', '2':'no'}, 'b': {'1':'yes', '2':'no'}})
 
@@ -81,15 +132,10 @@ class InputDataABC(ABC):
         self.datafile_name = datafile_name
         self.config = config
         self.naming_function = naming_function
+        self._data = data
 
-        if binary is not None:
-            self.binary = binary
-        else:
-            try:
-                with open(self.datafile_name, "rb") as file:
-                    self.binary = base64.b64encode(file.read()).decode()
-            except FileNotFoundError:
-                self.binary = None
+        # The base64 copy of the datafile is only built if something asks for it
+        self._binary_override = binary
 
         def default_repair_func(x):
             return (
@@ -116,11 +162,20 @@ class InputDataABC(ABC):
 
         self.question_texts = question_texts
         self.question_names = question_names
-        self.question_names_to_question_text = question_names_to_question_text
+        # Keyed by lowercased name so lookups are case-insensitive
+        self.question_names_to_question_text = (
+            {k.lower(): v for k, v in question_names_to_question_text.items()}
+            if question_names_to_question_text
+            else question_names_to_question_text
+        )
         self.answer_codebook = answer_codebook
+        reads_raw_data = raw_data is None
         self.raw_data = raw_data
 
-        self.apply_codebook()
+        # Readers that convert columns with _convert_column have already
+        # applied the codebook while reading
+        if not (reads_raw_data and self.codebook_applied_on_read):
+            self.apply_codebook()
 
         # Initialize modules using composition instead of mixins
         self.question_stats = QuestionStatsModule(self)
@@ -211,6 +266,26 @@ class InputDataABC(ABC):
     def order_options(self):
         return self.question_option.order_options()
 
+    @property
+    def binary(self) -> Optional[str]:
+        """Return the datafile base64-encoded, or None if it cannot be found.
+
+        The file is only read and encoded on first access.
+        """
+        if self._binary_override is None:
+            if self._data is not None:
+                self._binary_override = base64.b64encode(self._data).decode()
+            else:
+                try:
+                    self._binary_override = _b64encode_file(self.datafile_name)
+                except FileNotFoundError:
+                    return None
+        return self._binary_override
+
+    @binary.setter
+    def binary(self, value: Optional[str]) -> None:
+        self._binary_override = value
+
     @property
     def download_link(self):
         from IPython.display import HTML
@@ -274,14 +349,15 @@ class InputDataABC(ABC):
         ['evening', 'feeling']
 
         """
-        if old_name not in self.question_names:
+        try:
+            idx = self.question_index(old_name)
+        except ValueError:
             if ignore_missing:
                 return self
-            else:
-                raise ValueError(f"Question {old_name} not found.")
+            raise
 
-        idx = self.question_names.index(old_name)
-        self.question_names[idx] = new_name
+        self.question_names[idx] = sys.intern(new_name)
+        self._reindex()
         self.answer_codebook[new_name] = self.answer_codebook.pop(old_name, {})
 
         return self
@@ -294,18 +370,30 @@ class InputDataABC(ABC):
         ['feeling']
 
         """
-        if question_name not in self.question_names:
-            if ignore_missing:
-                return self
-            else:
-                raise ValueError(f"Question {question_name} not found.")
-        idx = self.question_names.index(question_name)
-        self._question_names.pop(idx)
-        self._question_texts.pop(idx)
-        self.question_type.question_types.pop(idx)
-        self.question_option.question_options.pop(idx)
-        self.raw_data.pop(idx)
-        self.answer_codebook.pop(question_name, None)
+        return self._drop_questions([question_name], ignore_missing=ignore_missing)
+
+    def _drop_questions(self, question_names, ignore_missing=False):
+        """Drop several questions, rebuilding the question lists once.
+
+        >>> id = InputDataABC.example()
+        >>> id._drop_questions(['morning', 'feeling']).question_names
+        []
+        >>> id._drop_questions(['evening'])
+        Traceback (most recent call last):
+        ...
+        ValueError: Question evening not found.
+        """
+        drop = set()
+        for qn in question_names:
+            try:
+                drop.add(self.question_index(qn))
+            except ValueError:
+                if not ignore_missing:
+                    raise
+        if drop:
+            self._retain_questions(
+                [i for i in range(len(self.question_names)) if i not in drop]
+            )
         return self
 
     def drop(self, *question_names_to_drop) -> "InputData":
@@ -316,9 +404,7 @@ class InputDataABC(ABC):
         ['feeling']
 
         """
-        for qn in question_names_to_drop:
-            self._drop_question(qn)
-        return self
+        return self._drop_questions(question_names_to_drop)
 
     def keep(self, *question_names_to_keep, ignore_missing=False) -> "InputDataABC":
         """Keep a question.
@@ -328,12 +414,31 @@ class InputDataABC(ABC):
         ['morning']
 
         """
-        all_question_names = self._question_names[:]
-        for qn in all_question_names:
-            if qn not in question_names_to_keep:
-                self._drop_question(qn, ignore_missing=ignore_missing)
+        keep = set(question_names_to_keep)
+        self._retain_questions(
+            [i for i, qn in enumerate(self.question_names) if qn in keep]
+        )
         return self
 
+    def _retain_questions(self, idxs: List[int]) -> None:
+        """Keep only the questions at the given positions.
+
+        Every list that runs parallel to the question names is rebuilt once,
+        rather than popped from question by question.
+        """
+        kept = set(idxs)
+        for i, qn in enumerate(self.question_names):
+            if i not in kept:
+                self.answer_codebook.pop(qn, None)
+        question_types = self.question_type.question_types
+        question_options = self.question_option.question_options
+        self._question_names = [self._question_names[i] for i in idxs]
+        self._question_texts = [self._question_texts[i] for i in idxs]
+        self.question_type.question_types = [question_types[i] for i in idxs]
+        self.question_option.question_options = [question_options[i] for i in idxs]
+        self._raw_data = [self.raw_data[i] for i in idxs]
+        self._reindex()
+
     def modify_question_type(
         self,
         question_name: str,
@@ -353,15 +458,15 @@ class InputDataABC(ABC):
         ...
         ValueError: Question type poop is not available.
         """
-        old_type = self.question_type.question_types[self.question_names.index(question_name)]
-        old_options = self.question_option.question_options[self.question_names.index(question_name)]
+        idx = self.question_index(question_name)
+        old_type = self.question_type.question_types[idx]
+        old_options = self.question_option.question_options[idx]
 
         from edsl.questions import Question
 
         if new_type not in Question.available():
             raise ValueError(f"Question type {new_type} is not available.")
 
-        idx = self.question_names.index(question_name)
         self.question_type.question_types[idx] = new_type
         if drop_options:
             self.question_option.question_options[idx] = None
@@ -369,7 +474,6 @@ class InputDataABC(ABC):
             self.question_option.question_options[idx] = new_options
 
         try:
-            idx = self.question_names.index(question_name)
             rq = self.raw_question(idx)
             q = rq.to_question()
         except Exception as e:
@@ -385,28 +489,27 @@ class InputDataABC(ABC):
             self.question_option.question_options[idx] = old_options
         return self
 
-    @property
-    def num_observations(self):
-        """Return the number of observations.
+    def to_dict(self, include_binary: bool = False):
+        """Return a dictionary representation of the input data.
 
-        >>> id = InputDataABC.example()
-        >>> id.num_observations
-        2
+        :param include_binary: If True, include the base64-encoded datafile, which is built on demand.
 
+        >>> id = InputDataABC.example()
+        >>> "binary" in id.to_dict()
+        False
         """
-        return len(self.raw_data[0])
-
-    def to_dict(self):
-        return {
+        d = {
             "datafile_name": self.datafile_name,
             "config": self.config,
             "raw_data": self.raw_data,
             "question_names": self.question_names,
             "question_texts": self.question_texts,
-            "binary": self.binary,
             "answer_codebook": self.answer_codebook,
             "question_types": self.question_type.question_types,
         }
+        if include_binary:
+            d["binary"] = self.binary
+        return d
 
     @classmethod
     def from_dict(cls, d: Dict):
@@ -439,9 +542,9 @@ class InputDataABC(ABC):
             if len(set(value)) != len(value):
                 raise ValueError("Question names must be unique.")
             for i, qn in enumerate(value):
-                if not is_valid_variable_name(qn, allow_name=False):
+                if not _is_valid_question_name(qn):
                     new_name = self.question_name_repair_func(qn)
-                    if not is_valid_variable_name(new_name, allow_name=False):
+                    if not _is_valid_question_name(new_name):
                         raise ValueError(
                             f"""Question names must be valid Python identifiers. '{qn}' is not.""",
                             """You can pass an entry in question_name_repair_func to fix this.""",
@@ -450,7 +553,59 @@ class InputDataABC(ABC):
                         value[i] = new_name
                 else:
                     value[i] = qn
-        self._question_names = value
+        # Interned so every trait dict, Scenario and lookup shares the same key objects
+        self._question_names = [sys.intern(qn) for qn in value]
+        self._reindex()
+
+    def _reindex(self) -> None:
+        """Refresh the lookups derived from the question names.
+
+        Must be called whenever the question names are modified in place.
+        """
+        self._question_names_lower = [qn.lower() for qn in self._question_names]
+        self._lower_question_names = frozenset(self._question_names_lower)
+        self._name_to_idx = {qn: i for i, qn in enumerate(self._question_names)}
+        self._invalidate_caches()
+
+    def _invalidate_caches(self) -> None:
+        """Drop the views derived from the questions and responses.
+
+        Must be called whenever either is modified.
+        """
+        if hasattr(self, "question_stats"):
+            self.question_stats.clear_cache()
+
+    def question_index(self, question_name: str) -> int:
+        """Return the position of a question in the question names.
+
+        >>> id = InputDataABC.example()
+        >>> id.question_index('feeling')
+        1
+        >>> id.question_index('evening')
+        Traceback (most recent call last):
+        ...
+        ValueError: Question evening not found.
+        """
+        if not hasattr(self, "_question_names"):
+            self.question_names = None
+        try:
+            return self._name_to_idx[question_name]
+        except KeyError:
+            raise ValueError(f"Question {question_name} not found.") from None
+
+    @property
+    def lower_question_names(self) -> frozenset:
+        """Return the set of lowercased question names, for case-insensitive matching.
+
+        >>> id = InputDataABC.example()
+        >>> sorted(id.lower_question_names)
+        ['feeling', 'morning']
+        >>> sorted(id.rename('morning', 'Evening').lower_question_names)
+        ['evening', 'feeling']
+        """
+        if not hasattr(self, "_question_names"):
+            self.question_names = None
+        return self._lower_question_names
 
     @property
     def question_texts(self) -> List[str]:
@@ -470,6 +625,7 @@ class InputDataABC(ABC):
         if value is None:
             value = self.get_question_texts()
         self._question_texts = value
+        self._invalidate_caches()
 
     @property
     def raw_data(self):
@@ -491,12 +647,10 @@ class InputDataABC(ABC):
             value = self.get_raw_data()
             # self.apply_codebook()
         self._raw_data = value
+        self._invalidate_caches()
 
     def to_dataset(self) -> "Dataset":
-        dataset_list = []
-        for key, value in zip(self.question_names, self.raw_data):
-            dataset_list.append({key: value})
-        return Dataset(dataset_list)
+        return Dataset([{key: value} for key, value in zip(self.question_names, self.raw_data)])
 
     def to_scenario_list(self) -> ScenarioList:
         """Return a ScenarioList object from the raw response data.
@@ -510,11 +664,11 @@ class InputDataABC(ABC):
         ScenarioList([Scenario({'morning': '1', 'feeling': '3'}), Scenario({'morning': '4', 'feeling': '6'})])
 
         """
-        s = ScenarioList()
-        for qn in self.question_names:
-            idx = self.question_names.index(qn)
-            s = s.add_list(qn, self.raw_data[idx])
-        return s
+        question_names = self.question_names
+        # One Scenario per observation, built in a single pass over the rows
+        return ScenarioList(
+            [Scenario(dict(zip(question_names, row))) for row in zip(*self.raw_data)]
+        )
 
     @property
     def names_to_texts(self) -> dict:
@@ -525,7 +679,7 @@ class InputDataABC(ABC):
         >>> id.names_to_texts
         {'morning': 'how are you doing this morning?', 'feeling': 'how are you feeling?'}
         """
-        return {n: t for n, t in zip(self.question_names, self.question_texts)}
+        return dict(zip(self.question_names, self.question_texts))
 
     @property
     def texts_to_names(self):
@@ -536,15 +690,17 @@ class InputDataABC(ABC):
         {'how are you doing this morning?': 'morning', 'how are you feeling?': 'feeling'}
 
         """
-        return {t: n for n, t in self.names_to_texts.items()}
+        return dict(zip(self.question_texts, self.question_names))
 
     def raw_question(self, index: int) -> RawQuestion:
         question_name = self.question_names[index]
         
         # Use question_names_to_question_text mapping if available, otherwise use question_texts
         # Use case-insensitive matching for dictionary lookups
-        if self.question_names_to_question_text and question_name.lower() in self.question_names_to_question_text:
-            question_text = self.question_names_to_question_text[question_name.lower()]
+        names_to_text = self.question_names_to_question_text
+        lower_name = self._question_names_lower[index]
+        if names_to_text and lower_name in names_to_text:
+            question_text = names_to_text[lower_name]
         else:
             question_text = self.question_texts[index]
         
@@ -558,9 +714,23 @@ class InputDataABC(ABC):
 
     def raw_questions(self) -> Generator[RawQuestion, None, None]:
         """Return a generator of RawQuestion objects."""
-        for qn in self.question_names:
-            idx = self.question_names.index(qn)
-            yield self.raw_question(idx)
+        # Bind the parallel lists once rather than resolving them for every question
+        question_names = self.question_names
+        question_texts = self.question_texts
+        question_types = self.question_type.question_types
+        question_options = self.question_option.question_options
+        raw_data = self.raw_data
+        names_to_text = self.question_names_to_question_text or {}
+        for idx, lower_name in enumerate(self._question_names_lower):
+            yield RawQuestion(
+                question_type=question_types[idx],
+                question_name=question_names[idx],
+                question_text=(
+                    names_to_text[lower_name] if lower_name in names_to_text else question_texts[idx]
+                ),
+                responses=raw_data[idx],
+                question_options=question_options[idx],
+            )
 
     def questions(self) -> Generator[Union[QuestionBase, None], None, None]:
         """Return a generator of Question objects."""
@@ -570,7 +740,7 @@ class InputDataABC(ABC):
             except Exception as e:
                 # Log error to centralized logger instead of printing to stderr
                 options_info = getattr(rq, 'options', 'N/A')
-                log_creation_error(rq.question_name, e)
+                self.question_error_logger.log_creation_error(rq.question_name, e)
                 yield None
 
     def select(self, *question_names: List[str]) -> "InputData":
@@ -584,7 +754,7 @@ class InputDataABC(ABC):
 
         """
 
-        idxs = [self.question_names.index(qn) for qn in question_names]
+        idxs = [self.question_index(qn) for qn in question_names]
         new_data = [self.raw_data[i] for i in idxs]
         new_texts = [self.question_texts[i] for i in idxs]
         new_types = [self.question_type.question_types[i] for i in idxs]
@@ -613,21 +783,20 @@ class InputDataABC(ABC):
         True
 
         """
-        console = Console(stderr=True)
         s = Survey()
         
-        questions_list = list(self.questions())
+        num_questions = len(self.question_names)
         
         if verbose:
-            console.print(f"[dim]Building survey from {len(questions_list)} questions[/dim]")
+            console = Console(stderr=True)
+            console.print(f"[dim]Building survey from {num_questions} questions[/dim]")
         
         # If we have a progress callback, use it instead of creating our own progress
         if progress_callback:
-            for i, q in enumerate(questions_list):
-                if q is not None:
-                    s.add_question(q)
-                if i % max(1, len(questions_list) // 20) == 0:  # Update every 5%
-                    progress_callback(i + 1)
+            valid_questions = self._add_questions(s, progress_callback)
+        elif not verbose:
+            # Nothing to display, so skip setting up a progress bar at all
+            valid_questions = self._add_questions(s, lambda completed: None)
         else:
             # Use our own progress bar when no callback provided
             with Progress(
@@ -636,22 +805,15 @@ class InputDataABC(ABC):
                 BarColumn(),
                 TaskProgressColumn(),
                 console=console,
-                disable=not verbose
             ) as progress:
                 
-                task = progress.add_task("[cyan]Adding questions to survey...", total=len(questions_list))
-                
-                for i, q in enumerate(questions_list):
-                    if q is not None:
-                        s.add_question(q)
-                    if i % max(1, len(questions_list) // 10) == 0:  # Update every 10%
-                        progress.update(task, completed=i + 1)
-                        
-                progress.update(task, completed=len(questions_list))
+                task = progress.add_task("[cyan]Adding questions to survey...", total=num_questions)
+                valid_questions = self._add_questions(
+                    s, lambda completed: progress.update(task, completed=completed)
+                )
             
         if verbose:
-            valid_questions = sum(1 for q in questions_list if q is not None)
-            invalid_questions = len(questions_list) - valid_questions
+            invalid_questions = num_questions - valid_questions
             console.print(f"[green]✓[/green] Added {valid_questions} valid questions to survey")
             if invalid_questions > 0:
                 console.print(f"[yellow]⚠[/yellow] Skipped {invalid_questions} invalid questions")
@@ -662,17 +824,41 @@ class InputDataABC(ABC):
             
         return s
 
+    def _add_questions(self, survey: Survey, update_progress: Callable[[int], None]) -> int:
+        """Add each question to the survey as it is built, returning how many were valid.
+
+        Progress is reported at most every PROGRESS_UPDATE_INTERVAL seconds, and
+        once more when all the questions have been added.
+        """
+        valid_questions = 0
+        completed = 0
+        last_update = time.monotonic()
+        for completed, q in enumerate(self.questions(), start=1):
+            if q is not None:
+                survey.add_question(q)
+                valid_questions += 1
+            now = time.monotonic()
+            if now - last_update >= PROGRESS_UPDATE_INTERVAL:
+                update_progress(completed)
+                last_update = now
+        update_progress(completed)
+        return valid_questions
+
     def print(self):
-        sl = (
-            ScenarioList.from_list("question_name", self.question_names)
-            .add_list("question_text", self.question_texts)
-            .add_list("inferred_question_type", self.question_type.question_types)
-            .add_list("num_responses", self.num_responses)
-            .add_list("num_unique_responses", self.num_unique_responses)
-            .add_list("missing", self.missing)
-            .add_list("frac_numerical", self.frac_numerical)
-            .add_list("top_5_items", self.question_stats.top_k(5))
-            .add_list("frac_obs_from_top_5", self.question_stats.frac_obs_from_top_k(5))
+        columns = {
+            "question_name": self.question_names,
+            "question_text": self.question_texts,
+            "inferred_question_type": self.question_type.question_types,
+            "num_responses": self.num_responses,
+            "num_unique_responses": self.num_unique_responses,
+            "missing": self.missing,
+            "frac_numerical": self.frac_numerical,
+            "top_5_items": self.question_stats.top_k(5),
+            "frac_obs_from_top_5": self.question_stats.frac_obs_from_top_k(5),
+        }
+        # One Scenario per question, built in a single pass
+        sl = ScenarioList(
+            [Scenario(dict(zip(columns, row))) for row in zip(*columns.values())]
         )
         sl.print()
 
@@ -709,9 +895,10 @@ class InputDataABC(ABC):
         1
 
         """
-        self.raw_data = [
-            [r for i, r in enumerate(row) if i not in indices] for row in self.raw_data
-        ]
+        drop = set(indices)
+        # Work out the surviving rows once, then gather them from every column
+        keep = [i for i in range(self.num_observations) if i not in drop]
+        self.raw_data = [[row[i] for i in keep] for row in self.raw_data]
         return self
 
     def _missing_indices(self, question_name):
@@ -723,8 +910,11 @@ class InputDataABC(ABC):
         >>> id._missing_indices('morning')
         [0]
         """
-        idx = self.question_names.index(question_name)
-        return [i for i, r in enumerate(self.raw_data[idx]) if r == "missing"]
+        responses = self.raw_data[self.question_index(question_name)]
+        # A C-level containment scan settles the common no-missing case cheaply
+        if "missing" not in responses:
+            return []
+        return [i for i, r in enumerate(responses) if r == "missing"]
 
     def drop_missing(self, question_name):
         """Drop missing values for a question.
@@ -747,8 +937,25 @@ class InputDataABC(ABC):
         >>> id = InputDataABC.example()
         >>> id.num_observations
         2
+        >>> id.keep().num_observations
+        0
+        """
+        # Not cached: callers may add or drop rows of raw_data in place
+        raw_data = self.raw_data
+        return len(raw_data[0]) if raw_data else 0
+
+    def _convert_column(self, question_name: str, values) -> list:
+        """Convert a column of raw cells and apply the question's answer codebook in one pass.
+
+        >>> id = InputDataABC.example(answer_codebook = {'morning':{1:'hello'}})
+        >>> id._convert_column('morning', ['1', '4', ''])
+        ['hello', 4, 'missing']
         """
-        return len(self.raw_data[0])
+        codebook = (self.answer_codebook or {}).get(question_name)
+        if not codebook:
+            return [convert_value(v) for v in values]
+        get = codebook.get
+        return [get(converted, converted) for converted in map(convert_value, values)]
 
     def apply_codebook(self) -> None:
         """Apply the codebook to the raw data.
@@ -761,15 +968,17 @@ class InputDataABC(ABC):
         >>> id.raw_data
         [['hello', '4'], ['3', '6']]
         """
+        raw_data = self.raw_data
         for index, qn in enumerate(self.question_names):
-            if qn in self.answer_codebook:
-                new_responses = [
-                    self.answer_codebook[qn].get(r, r) for r in self.raw_data[index]
-                ]
-                self.raw_data[index] = new_responses
+            codebook = self.answer_codebook.get(qn)
+            if not codebook:
+                continue
+            get = codebook.get
+            raw_data[index] = [get(r, r) for r in raw_data[index]]
+        self._invalidate_caches()
 
     def __repr__(self):
-        return f"{self.__class__.__name__}: datafile_name:'{self.datafile_name}' num_questions:{len(self.question_names)}, num_observations:{len(self.raw_data[0])}"
+        return f"{self.__class__.__name__}: datafile_name:'{self.datafile_name}' num_questions:{len(self.question_names)}, num_observations:{self.num_observations}"
 
     @classmethod
     def example(cls, **kwargs) -> "InputDataABC":
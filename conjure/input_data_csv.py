@@ -1,12 +1,14 @@
+import io
 from typing import List, Optional
 import pandas as pd
 import sys
 from .input_data import InputDataABC
-from .utilities import convert_value
 from rich.console import Console
 
 
 class InputDataCSV(InputDataABC):
+    codebook_applied_on_read = True
+
     def __init__(self, datafile_name: str, config: Optional[dict] = None, **kwargs):
         if config is None:
             config = {"skiprows": None, "delimiter": ","}
@@ -20,8 +22,10 @@ class InputDataCSV(InputDataABC):
             if verbose:
                 console.print(f"[dim]Loading CSV data from {self.datafile_name}[/dim]")
             
+            # In-memory data (e.g. piped from stdin) is parsed without touching disk
+            source = io.BytesIO(self._data) if self._data is not None else self.datafile_name
             self._df = pd.read_csv(
-                self.datafile_name,
+                source,
                 skiprows=self.config["skiprows"],
                 encoding_errors="ignore",
             )
@@ -41,9 +45,9 @@ class InputDataCSV(InputDataABC):
 
     def get_raw_data(self) -> List[List[str]]:
         verbose = getattr(self, '_verbose', False)
+        columns = self.get_df(verbose=verbose).to_dict(orient="list").values()
         data = [
-            [convert_value(obs) for obs in v]
-            for k, v in self.get_df(verbose=verbose).to_dict(orient="list").items()
+            self._convert_column(qn, v) for qn, v in zip(self.question_names, columns)
         ]
         return data
 
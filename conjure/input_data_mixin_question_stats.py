@@ -1,13 +1,73 @@
-import functools
-from typing import List
+from typing import Callable, Hashable, List
 from .utilities import Missing
-from collections import Counter
+from collections import Counter, namedtuple
+
+# The statistics for one question that can be read off its response counts
+ColumnSummary = namedtuple(
+    "ColumnSummary",
+    ["num_responses", "num_unique_responses", "missing", "unique_responses", "frac_numerical"],
+)
 
 
 class QuestionStatsModule:
     def __init__(self, input_data):
         self.input_data = input_data
-    
+        self.clear_cache()
+
+    def clear_cache(self) -> None:
+        """Forget the statistics computed so far.
+
+        Called by the input data whenever its questions or responses change.
+        """
+        self._cache = {}
+
+    def _cached(self, key: Hashable, compute: Callable[[], list]) -> list:
+        """Return the statistic stored under key, computing it on first use."""
+        if key not in self._cache:
+            self._cache[key] = compute()
+        return self._cache[key]
+
+    @property
+    def counters(self) -> List[Counter]:
+        """A Counter of the responses to each question, built once per change to the data."""
+        return self._cached(
+            "counters", lambda: [Counter(responses) for responses in self.input_data.raw_data]
+        )
+
+    def column_summaries(self) -> List[ColumnSummary]:
+        """Summarize the responses to each question.
+
+        All the summary statistics come from one pass over each question's
+        response counts, rather than a separate scan of the responses for each.
+
+        >>> from .input_data import InputDataABC
+        >>> id = InputDataABC.example()
+        >>> id.question_stats.column_summaries()[0]
+        ColumnSummary(num_responses=2, num_unique_responses=2, missing=0, unique_responses=['1', '4'], frac_numerical=0.0)
+        """
+        return self._cached("column_summaries", self._compute_column_summaries)
+
+    def _compute_column_summaries(self) -> List[ColumnSummary]:
+        missing_value = Missing().value()
+        summaries = []
+        for responses, counter in zip(self.input_data.raw_data, self.counters):
+            num_responses = len(responses)
+            num_numerical = sum(
+                count for value, count in counter.items() if isinstance(value, (int, float))
+            )
+            summaries.append(
+                ColumnSummary(
+                    num_responses=num_responses,
+                    num_unique_responses=len(counter),
+                    missing=counter[missing_value],
+                    unique_responses=[
+                        v for v in counter if v != missing_value and v != "missing" and v != ""
+                    ],
+                    frac_numerical=num_numerical / num_responses if num_responses else 0.0,
+                )
+            )
+        return summaries
+
     def question_statistics(self, question_name: str) -> "QuestionStats":
         """Return statistics for a question."""
         return self.input_data.QuestionStats(**self._compute_question_statistics(question_name))
@@ -21,7 +81,7 @@ class QuestionStatsModule:
         >>> id.question_stats._compute_question_statistics('morning')
         {'num_responses': 2, 'num_unique_responses': 2, 'missing': 0, 'unique_responses': ..., 'frac_numerical': 0.0, 'top_5': [('1', 1), ('4', 1)], 'frac_obs_from_top_5': 1.0}
         """
-        idx = self.input_data.question_names.index(question_name)
+        idx = self.input_data.question_index(question_name)
         return {attr: getattr(self, attr)[idx] for attr in self.input_data.question_attributes}
 
     @property
@@ -34,11 +94,10 @@ class QuestionStatsModule:
         >>> id.num_responses
         [2, 2]
         """
-        return self.compute_num_responses()
+        return self._cached("num_responses", self.compute_num_responses)
 
-    @functools.lru_cache(maxsize=1)
     def compute_num_responses(self):
-        return [len(responses) for responses in self.input_data.raw_data]
+        return [summary.num_responses for summary in self.column_summaries()]
 
     @property
     def num_unique_responses(self) -> List[int]:
@@ -50,11 +109,10 @@ class QuestionStatsModule:
         >>> id.num_unique_responses
         [2, 2]
         """
-        return self.compute_num_unique_responses()
+        return self._cached("num_unique_responses", self.compute_num_unique_responses)
 
-    @functools.lru_cache(maxsize=1)
     def compute_num_unique_responses(self):
-        return [len(set(responses)) for responses in self.input_data.raw_data]
+        return [summary.num_unique_responses for summary in self.column_summaries()]
 
     @property
     def missing(self) -> List[int]:
@@ -66,11 +124,10 @@ class QuestionStatsModule:
         [1]
 
         """
-        return self.compute_missing()
+        return self._cached("missing", self.compute_missing)
 
-    @functools.lru_cache(maxsize=1)
     def compute_missing(self):
-        return [sum([1 for x in v if x == Missing().value()]) for v in self.input_data.raw_data]
+        return [summary.missing for summary in self.column_summaries()]
 
     @property
     def frac_numerical(self) -> List[float]:
@@ -82,16 +139,11 @@ class QuestionStatsModule:
         >>> input_data.frac_numerical
         [0.75]
         """
-        return self.compute_frac_numerical()
+        return self._cached("frac_numerical", self.compute_frac_numerical)
 
-    @functools.lru_cache(maxsize=1)
     def compute_frac_numerical(self):
-        return [
-            sum([1 for x in v if isinstance(x, (int, float))]) / len(v)
-            for v in self.input_data.raw_data
-        ]
+        return [summary.frac_numerical for summary in self.column_summaries()]
 
-    @functools.lru_cache(maxsize=1)
     def top_k(self, k: int) -> List[List[tuple]]:
         """
         >>> from .input_data import InputDataABC
@@ -101,9 +153,11 @@ class QuestionStatsModule:
         >>> input_data.question_stats.top_k(2)
         [[(1, 5), (2, 1)]]
         """
-        return [Counter(value).most_common(k) for value in self.input_data.raw_data]
+        return self._cached(
+            ("top_k", k),
+            lambda: [counter.most_common(k) for counter in self.counters],
+        )
 
-    @functools.lru_cache(maxsize=1)
     def frac_obs_from_top_k(self, k):
         """
         Return the fraction of observations that are in the top k for each question.
@@ -113,14 +167,16 @@ class QuestionStatsModule:
         >>> input_data.question_stats.frac_obs_from_top_k(1)
         [0.8]
         """
-        return [
-            round(
-                sum([x[1] for x in Counter(value).most_common(k) if x[0] != "missing"])
-                / len(value),
-                2,
-            )
-            for value in self.input_data.raw_data
-        ]
+        return self._cached(
+            ("frac_obs_from_top_k", k),
+            lambda: [
+                round(
+                    sum([count for value, count in top if value != "missing"]) / num_responses,
+                    2,
+                )
+                for top, num_responses in zip(self.top_k(k), self.num_responses)
+            ],
+        )
 
     @property
     def frac_obs_from_top_5(self):
@@ -141,13 +197,10 @@ class QuestionStatsModule:
         >>> id.unique_responses
         [..., ...]
         """
-        return self.compute_unique_responses()
+        return self._cached("unique_responses", self.compute_unique_responses)
 
-    @functools.lru_cache(maxsize=1)
     def compute_unique_responses(self):
-        return [
-            list(set(self.filter_missing(responses))) for responses in self.input_data.raw_data
-        ]
+        return [summary.unique_responses for summary in self.column_summaries()]
 
     @staticmethod
     def filter_missing(responses) -> List[str]:
@@ -167,9 +220,8 @@ class QuestionStatsModule:
         [[...], [...]]
 
         """
-        counters = [Counter(responses) for responses in self.input_data.raw_data]
         new_counters = []
-        for question in counters:
+        for question in self.counters:
             top_options = []
             for option, count in question.items():
                 if count > k and (option != "missing" or not remove_missing):
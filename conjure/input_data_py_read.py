@@ -1,8 +1,9 @@
+import os
+import tempfile
 import pandas as pd
 from typing import List
 
 from .input_data import InputDataABC
-from .utilities import convert_value
 from edsl.utilities import is_valid_variable_name
 
 try:
@@ -13,14 +14,39 @@ except ImportError as e:
         "pip install pyreadstat\n"
     ) from e
 
+# Size of each os.write when spooling in-memory data to a temporary file
+WRITE_BLOCK_SIZE = 1 << 20
+
 
 class InputDataPyRead(InputDataABC):
+    codebook_applied_on_read = True
+
     def pyread_function(self, datafile_name):
         raise NotImplementedError
 
+    def _read(self):
+        """Read the datafile, spooling in-memory data to a temporary file for pyreadstat."""
+        if self._data is None:
+            return self.pyread_function(self.datafile_name)
+
+        # pyreadstat can only read from a path; copy the bytes out in large raw
+        # writes rather than through a buffered file object
+        fd, temp_path = tempfile.mkstemp(suffix=os.path.splitext(self.datafile_name)[1])
+        try:
+            try:
+                view = memoryview(self._data)
+                offset = 0
+                while offset < len(view):
+                    offset += os.write(fd, view[offset:offset + WRITE_BLOCK_SIZE])
+            finally:
+                os.close(fd)
+            return self.pyread_function(temp_path)
+        finally:
+            os.unlink(temp_path)
+
     def _parse(self) -> None:
         try:
-            df, meta = self.pyread_function(self.datafile_name)
+            df, meta = self._read()
         except Exception as e:
             raise ValueError(
                 f"An error occurred while reading the file {self.datafile_name}."
@@ -50,10 +76,9 @@ class InputDataPyRead(InputDataABC):
         }
 
     def get_raw_data(self) -> List[List[str]]:
-        df = self.get_df()
+        columns = self.get_df().to_dict(orient="list").values()
         data = [
-            [convert_value(obs) for obs in v]
-            for k, v in df.to_dict(orient="list").items()
+            self._convert_column(qn, v) for qn, v in zip(self.question_names, columns)
         ]
         return data
 
@@ -5,14 +5,49 @@ Collects question processing errors and provides clean user feedback.
 
 import os
 import sys
+import queue
+import atexit
 import logging
+import weakref
+import threading
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Any
+from collections import defaultdict
+from contextvars import ContextVar
+from typing import List, Dict, Any, Optional
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
-from rich.text import Text
+
+# One entry in the error log file
+_LOG_FMT = "[%s] Question: %s\nError Type: %s\nDetails: %s\n%s" + "-" * 80 + "\n\n"
+
+
+def _create_log_file(log_file: Path, datafile_name: str, generated: str):
+    """Create the log directory and write the log file's header, unless the file already exists."""
+    if log_file.exists():
+        return
+    log_file.parent.mkdir(exist_ok=True)
+    with open(log_file, 'w') as f:
+        f.write(
+            f"Question Processing Error Log\n"
+            f"Generated: {generated}\n"
+            f"Data file: {datafile_name}\n"
+            f"{'='*80}\n\n"
+        )
+
+
+class _DeferredLogFileHandler(logging.FileHandler):
+    """A FileHandler that only creates the question error log when EDSL first logs to it."""
+    
+    def __init__(self, log_file: Path, datafile_name: str, generated: str):
+        self._datafile_name = datafile_name
+        self._generated = generated
+        super().__init__(log_file, mode='a', delay=True)
+    
+    def _open(self):
+        _create_log_file(Path(self.baseFilename), self._datafile_name, self._generated)
+        return super()._open()
 
 
 class QuestionErrorLogger:
@@ -22,27 +57,36 @@ class QuestionErrorLogger:
         self.datafile_name = datafile_name
         self.verbose = verbose
         self.errors: List[Dict[str, Any]] = []
+        # Kept up to date as errors are logged, so summaries need not regroup them
+        self._by_type: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        self._failed_names: List[str] = []
         self.console = Console(stderr=True)
         
-        # Create logs directory if it doesn't exist
+        # Name the timestamped log file; the directory and file are only
+        # created once something is logged
         self.log_dir = Path("conjure_logs")
-        self.log_dir.mkdir(exist_ok=True)
-        
-        # Create timestamped log file
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        now = datetime.now()
+        self._created_iso = now.isoformat()
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
         safe_filename = Path(datafile_name).stem.replace(" ", "_")
         self.log_file = self.log_dir / f"question_errors_{safe_filename}_{timestamp}.log"
+        self._fd = None
         
-        # Initialize log file
-        with open(self.log_file, 'w') as f:
-            f.write(f"Question Processing Error Log\n")
-            f.write(f"Generated: {datetime.now().isoformat()}\n")
-            f.write(f"Data file: {datafile_name}\n")
-            f.write(f"{'='*80}\n\n")
+        # Entries are written by a background thread, started on the first error;
+        # it records write failures here for flush() to raise
+        self._queue: queue.Queue = queue.Queue()
+        self._writer = None
+        self._write_failures: List[Exception] = []
         
         # Configure EDSL logging to suppress error messages to stdout
         self._configure_edsl_logging()
     
+    def _ensure_init(self):
+        """Create the log file if needed and hold a raw append-only descriptor to it for the logger's lifetime."""
+        if self._fd is None:
+            _create_log_file(self.log_file, self.datafile_name, self._created_iso)
+            self._fd = os.open(str(self.log_file), os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+    
     def _configure_edsl_logging(self):
         """Configure EDSL logging to redirect errors to our log file instead of stdout."""
         # Get the EDSL logger
@@ -55,8 +99,8 @@ class QuestionErrorLogger:
         # Set the logging level to capture errors but redirect them
         edsl_logger.setLevel(logging.ERROR)
         
-        # Create a file handler that writes to our error log
-        file_handler = logging.FileHandler(self.log_file, mode='a')
+        # Create a file handler that writes to our error log, once there is something to write
+        file_handler = _DeferredLogFileHandler(self.log_file, self.datafile_name, self._created_iso)
         file_handler.setLevel(logging.ERROR)
         
         # Create a formatter for the log messages  
@@ -80,8 +124,9 @@ class QuestionErrorLogger:
     
     def log_question_error(self, question_name: str, error_type: str, details: str, exception: Exception = None):
         """Log a question processing error."""
+        timestamp = datetime.now().isoformat()
         error_entry = {
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': timestamp,
             'question_name': question_name,
             'error_type': error_type,
             'details': details,
@@ -89,15 +134,94 @@ class QuestionErrorLogger:
         }
         
         self.errors.append(error_entry)
+        self._by_type[error_type].append(error_entry)
+        self._failed_names.append(question_name)
         
-        # Write to log file immediately
-        with open(self.log_file, 'a') as f:
-            f.write(f"[{error_entry['timestamp']}] Question: {question_name}\n")
-            f.write(f"Error Type: {error_type}\n")
-            f.write(f"Details: {details}\n")
-            if exception:
-                f.write(f"Exception: {exception}\n")
-            f.write("-" * 80 + "\n\n")
+        # Hand the entry to the writer thread as a single formatted string
+        self._enqueue(
+            _LOG_FMT % (
+                timestamp,
+                question_name,
+                error_type,
+                details,
+                f"Exception: {exception}\n" if exception else "",
+            )
+        )
+
+    def _enqueue(self, text: str):
+        """Queue text for the writer thread, starting it if needed."""
+        if self._writer is None:
+            self._ensure_init()
+            self._writer = threading.Thread(
+                target=self._drain,
+                args=(self._queue, self._fd, self._write_failures),
+                name="conjure-error-log",
+                daemon=True,
+            )
+            self._writer.start()
+            _open_loggers.add(self)
+        self._queue.put(text)
+
+    @staticmethod
+    def _drain(entries: queue.Queue, fd: int, failures: List[Exception]):
+        """Write queued entries until the None sentinel, batching whatever is waiting into one os.write.
+
+        A staticmethod so the thread holds no reference to the logger itself.
+        A failed write is appended to failures rather than ending the thread,
+        and every entry is marked done either way so flush() cannot hang.
+        """
+        while True:
+            batch = [entries.get()]
+            while True:
+                try:
+                    batch.append(entries.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                data = memoryview("".join(t for t in batch if t is not None).encode("utf-8"))
+                while data:
+                    data = data[os.write(fd, data):]
+            except Exception as e:
+                failures.append(e)
+            finally:
+                for _ in batch:
+                    entries.task_done()
+            if None in batch:
+                return
+
+    def _raise_write_failure(self):
+        """Raise the first error the writer thread hit since the last check, if any."""
+        if self._write_failures:
+            failure = self._write_failures[0]
+            self._write_failures.clear()
+            raise failure
+
+    def flush(self):
+        """Block until every logged entry has been written to the log file.
+
+        Raises the error if the writer thread failed to write an entry.
+        """
+        if self._writer is not None:
+            self._queue.join()
+        self._raise_write_failure()
+
+    def close(self):
+        """Write any pending entries, stop the writer thread and close the log file."""
+        if self._writer is not None:
+            self._queue.put(None)
+            self._writer.join()
+            self._writer = None
+            _open_loggers.discard(self)
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+        self._raise_write_failure()
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
     
     def log_insufficient_options_error(self, question_name: str, options_info: str):
         """Log an insufficient options error specifically."""
@@ -121,13 +245,15 @@ class QuestionErrorLogger:
         if not self.errors:
             return
         
-        # Group errors by type
-        error_by_type = {}
-        for error in self.errors:
-            error_type = error['error_type']
-            if error_type not in error_by_type:
-                error_by_type[error_type] = []
-            error_by_type[error_type].append(error)
+        # Make sure the detailed log the summary points to is complete
+        self.flush()
+        
+        error_by_type = self._by_type
+        
+        # Without a terminal to render to, skip rich's layout work entirely
+        if not sys.stderr.isatty():
+            self._plain_summary(error_by_type)
+            return
         
         # Create summary table
         table = Table(title="Question Processing Issues", show_header=True, header_style="bold magenta")
@@ -139,13 +265,7 @@ class QuestionErrorLogger:
         
         for error_type, type_errors in error_by_type.items():
             count = len(type_errors)
-            # Show first few question names as examples
-            examples = [e['question_name'] for e in type_errors[:3]]
-            if count > 3:
-                examples.append(f"... and {count - 3} more")
-            example_text = ", ".join(examples)
-            
-            table.add_row(error_type, str(count), example_text)
+            table.add_row(error_type, str(count), self._example_text(type_errors, count))
         
         # Create summary panel
         summary_text = f"[bold red]{total_errors}[/bold red] questions had processing issues and were omitted"
@@ -166,47 +286,86 @@ class QuestionErrorLogger:
             self.console.print(table)
         self.console.print()
     
+    def _plain_summary(self, error_by_type: Dict[str, List[Dict[str, Any]]]):
+        """Write the error summary to stderr as plain text."""
+        lines = [
+            "",
+            f"Question Processing Summary: {len(self.errors)} questions had processing issues and were omitted",
+            f"Detailed error log: {self.log_file}",
+        ]
+        for error_type, type_errors in error_by_type.items():
+            count = len(type_errors)
+            lines.append(f"  {error_type}: {count} ({self._example_text(type_errors, count)})")
+        sys.stderr.write("\n".join(lines) + "\n\n")
+    
+    @staticmethod
+    def _example_text(type_errors: List[Dict[str, Any]], count: int) -> str:
+        """Name the first few questions with an error, noting how many more there are."""
+        # Show first few question names as examples
+        examples = [e['question_name'] for e in type_errors[:3]]
+        if count > 3:
+            examples.append(f"... and {count - 3} more")
+        return ", ".join(examples)
+    
     def get_error_count(self) -> int:
         """Get the total number of errors logged."""
         return len(self.errors)
     
     def get_failed_questions(self) -> List[str]:
         """Get list of question names that failed."""
-        return [error['question_name'] for error in self.errors]
+        return list(self._failed_names)
     
     def has_errors(self) -> bool:
         """Check if any errors were logged."""
         return len(self.errors) > 0
 
 
-# Global logger instance - will be set by the main process
-_global_logger: QuestionErrorLogger = None
+# Loggers whose writer thread is running; it is a daemon thread, so they are
+# closed at exit to write out entries that were never flushed
+_open_loggers: "weakref.WeakSet[QuestionErrorLogger]" = weakref.WeakSet()
+
+
+@atexit.register
+def _close_open_loggers():
+    for logger in list(_open_loggers):
+        try:
+            logger.close()
+        except Exception as e:
+            sys.stderr.write(f"Could not write question error log {logger.log_file}: {e}\n")
+
+
+# Logger used by the module-level helpers below, which are kept for external
+# callers; conjure itself logs through each InputData's own logger. A context
+# variable, so it is only seen by the thread or task that set it.
+_logger_var: ContextVar[Optional[QuestionErrorLogger]] = ContextVar("conjure_logger", default=None)
 
 
 def set_global_logger(logger: QuestionErrorLogger):
-    """Set the global logger instance."""
-    global _global_logger
-    _global_logger = logger
+    """Set the logger instance for the current context."""
+    _logger_var.set(logger)
 
 
-def get_global_logger() -> QuestionErrorLogger:
-    """Get the global logger instance."""
-    return _global_logger
+def get_global_logger() -> Optional[QuestionErrorLogger]:
+    """Get the logger instance for the current context."""
+    return _logger_var.get()
 
 
 def log_question_error(question_name: str, error_type: str, details: str, exception: Exception = None):
     """Log a question error using the global logger."""
-    if _global_logger:
-        _global_logger.log_question_error(question_name, error_type, details, exception)
+    logger = _logger_var.get()
+    if logger:
+        logger.log_question_error(question_name, error_type, details, exception)
 
 
 def log_insufficient_options_error(question_name: str, options_info: str):
     """Log an insufficient options error using the global logger."""
-    if _global_logger:
-        _global_logger.log_insufficient_options_error(question_name, options_info)
+    logger = _logger_var.get()
+    if logger:
+        logger.log_insufficient_options_error(question_name, options_info)
 
 
 def log_creation_error(question_name: str, exception: Exception):
     """Log a question creation error using the global logger."""
-    if _global_logger:
-        _global_logger.log_creation_error(question_name, exception)
\ No newline at end of file
+    logger = _logger_var.get()
+    if logger:
+        logger.log_creation_error(question_name, exception)
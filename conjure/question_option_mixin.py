@@ -28,14 +28,14 @@ class QuestionOptionModule:
 
         """
         qt = self.input_data.question_stats.question_statistics(question_name)
-        idx = self.input_data.question_names.index(question_name)
+        idx = self.input_data.question_index(question_name)
         question_type = self.input_data.question_type.question_types[idx]
         if question_type == "multiple_choice":
             return [str(o) for o in qt.unique_responses]
         else:
             if question_type == "multiple_choice_with_other":
                 options = self.input_data.question_stats.unique_responses_more_than_k(2)[
-                    self.input_data.question_names.index(question_name)
+                    self.input_data.question_index(question_name)
                 ] + [self.input_data.OTHER_STRING]
                 return [str(o) for o in options]
             else:
@@ -1,7 +1,7 @@
 import os
 import sys
 import importlib
-import pkg_resources
+from importlib.metadata import entry_points
 from pprint import pprint
 
 # Check current directory
@@ -9,8 +9,8 @@ print("Current directory:", os.getcwd())
 
 # Check entry points
 print("\nEntry points:")
-edsl_entry_points = list(pkg_resources.iter_entry_points('edsl'))
-edsl_plugins_entry_points = list(pkg_resources.iter_entry_points('edsl_plugins'))
+edsl_entry_points = list(entry_points(group='edsl'))
+edsl_plugins_entry_points = list(entry_points(group='edsl_plugins'))
 print("edsl entry points:", edsl_entry_points)
 print("edsl_plugins entry points:", edsl_plugins_entry_points)
 
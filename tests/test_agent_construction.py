@@ -0,0 +1,58 @@
+from conjure.input_data import InputDataABC
+from conjure.agent_construction_mixin import DRYRUN_SAMPLE_SIZE
+
+
+class _TrackedColumn(list):
+    """A response column that records which observations are read from it."""
+
+    def __init__(self, values):
+        super().__init__(values)
+        self.read = set()
+
+    def __getitem__(self, index):
+        self.read.add(index)
+        return super().__getitem__(index)
+
+
+class _FakeSurvey:
+    """Stands in for a Survey, so running it needs no language model."""
+
+    questions = []
+
+    def by(self, agents):
+        self.agents = agents
+        return self
+
+    def run(self, **kwargs):
+        return None
+
+
+def test_dryrun_only_reads_sampled_rows(monkeypatch):
+    """Test that a dryrun builds agents from its sample without reading other rows."""
+    num_observations = 10 * DRYRUN_SAMPLE_SIZE
+    id = InputDataABC.example(
+        raw_data=[[str(i % 5) for i in range(num_observations)] for _ in range(2)]
+    )
+    columns = [_TrackedColumn(column) for column in id.raw_data]
+    id.raw_data = columns
+    survey = _FakeSurvey()
+    monkeypatch.setattr(id, "to_survey", lambda **kwargs: survey)
+
+    assert id.agent_construction.to_results(dryrun=True) is None
+    assert len(survey.agents) == DRYRUN_SAMPLE_SIZE
+    for column in columns:
+        assert len(column.read) == DRYRUN_SAMPLE_SIZE
+
+
+def test_agent_reflects_edited_question_texts():
+    """Test that agents pick up question texts and names edited in place."""
+    id = InputDataABC.example()
+    id.agent_construction.agent(0)
+
+    id.question_texts[0] = "how was your morning?"
+    assert id.agent_construction.agent(0).codebook["morning_agent"] == "how was your morning?"
+
+    id.question_names[1] = "mood"
+    agent = id.to_agent_list(indices=[0])[0]
+    assert agent.traits == {"morning_agent": "1", "mood_agent": "3"}
+    assert agent.codebook["mood_agent"] == "how are you feeling?"
@@ -0,0 +1,32 @@
+import io
+import sys
+
+import pytest
+from conjure.__main__ import _read_stdin, STDIN_READ_BLOCK_SIZE
+
+
+def _pipe(monkeypatch, data: bytes):
+    """Replace stdin with a non-terminal stream holding data."""
+    monkeypatch.setattr(sys, "stdin", io.TextIOWrapper(io.BytesIO(data)))
+
+
+def test_read_stdin_csv(monkeypatch):
+    """Test that piped data larger than one read block is returned whole."""
+    data = b"age,color\n" + b"1,red\n" * STDIN_READ_BLOCK_SIZE
+    _pipe(monkeypatch, data)
+    stdin_data, file_type = _read_stdin()
+    assert stdin_data == data
+    assert file_type == "csv"
+
+
+def test_read_stdin_sniffs_binary_format(monkeypatch):
+    """Test that the file type is taken from the leading bytes."""
+    _pipe(monkeypatch, b"$FL2" + b"\0" * 100)
+    assert _read_stdin()[1] == "sav"
+
+
+def test_read_stdin_empty(monkeypatch):
+    """Test that whitespace-only input exits with an error."""
+    _pipe(monkeypatch, b"  \n")
+    with pytest.raises(SystemExit):
+        _read_stdin()
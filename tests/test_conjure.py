@@ -20,4 +20,12 @@ def test_unsupported_file_type():
 # Additional tests you might want to add:
 # - test_conjure_sav_creation
 # - test_conjure_dta_creation
-# - test_to_results_method
\ No newline at end of file
+# - test_to_results_method
+
+def test_conjure_from_bytes():
+    """Test that Conjure.from_bytes parses in-memory CSV data."""
+    data = bytearray(b"age,color\n1,red\n2,blue\n")
+    report = Conjure.from_bytes(data, suffix="csv")
+    assert report.datafile_name == "stdin.csv"
+    assert report.question_names == ["age", "color"]
+    assert report.raw_data == [[1, 2], ["red", "blue"]]
@@ -0,0 +1,40 @@
+import os
+
+import pytest
+from conjure.question_error_logger import QuestionErrorLogger
+
+
+def test_log_file_created_on_first_error(tmp_path, monkeypatch):
+    """Test that the log directory and file only appear once an error is logged."""
+    monkeypatch.chdir(tmp_path)
+    logger = QuestionErrorLogger("survey data.csv")
+    assert not logger.log_dir.exists()
+
+    logger.log_creation_error("q1", ValueError("bad options"))
+    logger.flush()
+    contents = logger.log_file.read_text()
+    assert "Data file: survey data.csv" in contents
+    assert "Question: q1" in contents
+    assert "Exception: bad options" in contents
+    logger.close()
+
+
+def test_write_failure_raised_from_flush(tmp_path, monkeypatch):
+    """Test that a failed write is raised by flush() rather than hanging it."""
+    monkeypatch.chdir(tmp_path)
+    logger = QuestionErrorLogger("data.csv")
+    # Hand the writer thread a descriptor it cannot write to
+    logger._ensure_init()
+    os.close(logger._fd)
+    logger._fd = os.open(str(logger.log_file), os.O_RDONLY)
+
+    logger.log_creation_error("q1", ValueError("bad options"))
+    with pytest.raises(OSError):
+        logger.flush()
+
+    # The writer thread keeps running, and the failure is only raised once
+    logger.log_creation_error("q2", ValueError("bad options"))
+    with pytest.raises(OSError):
+        logger.flush()
+    logger.flush()
+    logger.close()